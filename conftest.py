@@ -0,0 +1,8 @@
+# Test-path shim: expose the src package under the installed name "d8fmt" so
+# the test suite's imports resolve without requiring an editable install.
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+import src
+sys.modules.setdefault("d8fmt", src)
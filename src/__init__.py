@@ -21,6 +21,8 @@ from .d8fmt import (
     is_zone_free,
     ez_format,
     datetime_ez,
+    make_d8fmt_parser,
+    run_cli,
 )
 from .constants import CANONICAL_DATE
 
@@ -31,4 +33,6 @@ __all__ = [
     "is_zone_free",
     "ez_format",
     "datetime_ez",
+    "make_d8fmt_parser",
+    "run_cli",
 ]
@@ -14,7 +14,6 @@ corresponding Python `datetime` format specifiers. These constants are essential
 1. **MACRO_LOOKUP_TABLE**:
    - Maps custom placeholders (e.g., `HOUR12`, `MONTH`, etc.) to their corresponding Python
      `strftime` format codes (e.g., `%I`, `%B`, etc.).
-   - The dictionary is ordered to ensure specific mappings are processed in a precise order.
 
 2. **DATETIME_LOOKUP_TABLE**:
    - Maps specific literal strings (e.g., `"October"`, `"Sun"`, `"305"`) to their corresponding
@@ -24,12 +23,11 @@ corresponding Python `datetime` format specifiers. These constants are essential
    - Helps in parsing specific datetime values from text or custom formats.
 
 ### Notes:
-- The dictionaries take advantage of Python's ordered nature (from version 3.7+) to ensure
-  replacement order is predictable.
+- Replacement is performed in a single longest-match-first pass, so the tables do not rely
+  on dictionary insertion order and overlapping keys (e.g., `"October"` vs. `"Oct"`) cannot
+  corrupt each other's output.
 - The **DATETIME_LOOKUP_TABLE** includes additional mappings for specific edge cases, such as
   week numbers, fractional seconds, and ISO-based weekdays.
-- Care should be taken when working with keys like `"0"` and `"7"`, as their mappings (`%w`
-  and `%u`) might behave differently depending on the context.
 
 ### Example Usage:
 1. Replace a `{HOUR12}` macro with `%I` using the `MACRO_LOOKUP_TABLE`.
@@ -57,8 +55,8 @@ These macros are utilized in formatting functions, such as `ez_format`, to dynam
 datetime strings in a more expressive and readable way.
 
 Key Concepts:
-- The dictionary is **ordered**, ensuring that replacements occur in the specified order,
-  which is particularly important if there are overlapping keys (e.g., "AM" and "PM").
+- Macros are expanded via `str.format`, and canonical replacements are applied in a single
+  longest-key-first pass derived at import time, so insertion order carries no meaning.
 - This abstraction enables easy customization and extension of datetime formatting behavior.
 
 Key-Value Mapping Example:
@@ -159,14 +157,9 @@ DATETIME_LOOKUP_TABLE = {
     "PM": "%p",  # AM/PM marker
     "am": "%p",  # AM/PM marker
     "pm": "%p",  # AM/PM marker
-    # ".000000": ".%f",  # Microseconds (truncated example)
-    # ".00000": ".%f" , # Microseconds (truncated example)
-    # ".0000": ".%f",  # Microseconds (truncated example)
-    # ".000": ".%f",  # Microseconds (truncated example)
-    # ".00": ".%f",  # Microseconds (truncated example)
-    # ".0": ".%f",  # Microseconds (truncated example)
-
-    # These will be problematic
+
+    # Single-digit entries are safe: replacement is a single longest-match
+    # pass, so these only apply where no longer token matches.
     "0": "%w",  # 0th day of week ( 0-6)
     "7": "%u",  # 7th day of week (ISO 1-7)
 }
@@ -22,10 +22,140 @@
 
 import argparse
 import datetime as dt
+import functools
 import re
 import sys
+import types
 
-from .constants import DATETIME_LOOKUP_TABLE, MACRO_LOOKUP_TABLE
+from .constants import CANONICAL_DATE, DATETIME_LOOKUP_TABLE, MACRO_LOOKUP_TABLE
+
+try:
+    # Optional accelerator: pyahocorasick provides a C-level automaton over
+    # the fixed replacement table.  The regex path is used when it is absent.
+    import ahocorasick
+except ImportError:  # pragma: no cover
+    ahocorasick = None
+
+try:
+    # Optional accelerator for batch formatting: pandas pushes the
+    # per-element strftime loop into vectorized DatetimeIndex code.
+    import pandas
+except ImportError:  # pragma: no cover
+    pandas = None
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_replacements(keys: tuple[str, ...]) -> re.Pattern:
+    """
+    Compile a single alternation regex matching any of the given replacement keys.
+
+    Keys are sorted longest-first so the regex engine always prefers the longer
+    token (e.g., "October" over "Oct", "305" over "0") and the whole table can
+    be applied in one pass over the format string instead of one full
+    str.replace() scan per key.  Compiled patterns are cached so repeated calls
+    with the same key set (including the default table) reuse the same regex.
+    """
+    ordered = sorted(keys, key=len, reverse=True)
+    return re.compile("|".join(re.escape(key) for key in ordered))
+
+
+# The default table never changes, so everything derived from it (the
+# read-only views, the compiled pattern, the translate table, and the
+# automaton below) is built once at import time.  Multi-character tokens are
+# matched by the pattern/automaton; single-character tokens are applied
+# afterwards with str.translate, which runs at C speed.  Directive output
+# (e.g. "%Y", "%d") contains none of the single-character keys, so the two
+# tiers cannot interfere.
+_DEFAULT_TABLE = types.MappingProxyType(
+    {key: value for key, value in DATETIME_LOOKUP_TABLE.items() if len(key) > 1})
+_SINGLE_CHAR_TRANS = str.maketrans(
+    {key: value for key, value in DATETIME_LOOKUP_TABLE.items() if len(key) == 1})
+_DEFAULT_PATTERN = _compile_replacements(tuple(_DEFAULT_TABLE))
+
+
+def _build_dispatch(table):
+    """
+    Generate a regex sub callback that resolves tokens with a match statement.
+
+    Keys sharing a replacement are grouped into one or-pattern, producing a
+    body like::
+
+        case "October" | "OCTOBER" | "october":
+            return "%B"
+
+    The literal string patterns compile to direct comparisons, avoiding a
+    hash computation and dict probe per matched token.  A wildcard case
+    falls back to the table itself, which can only trigger if the table and
+    the compiled pattern somehow diverge.
+    """
+    by_value: dict[str, list[str]] = {}
+    for key, value in table.items():
+        by_value.setdefault(value, []).append(key)
+
+    lines = ["def _dispatch(match):", "    match match.group(0):"]
+    for value, keys in by_value.items():
+        alternatives = " | ".join(repr(key) for key in keys)
+        lines.append(f"        case {alternatives}:")
+        lines.append(f"            return {value!r}")
+    lines.append("        case token:")
+    lines.append("            return _table[token]")
+
+    namespace = {"_table": table}
+    exec("\n".join(lines), namespace)  # noqa: S102 - source built from the static table
+    return namespace["_dispatch"]
+
+
+_default_dispatch = _build_dispatch(_DEFAULT_TABLE)
+
+# Pre-bound sub() so the fallback hot path is a single call straight into the
+# C regex engine with no per-call attribute lookup.
+_DEFAULT_SUB = _DEFAULT_PATTERN.sub
+
+
+def _build_automaton(table: dict[str, str]):
+    """Build an Aho-Corasick automaton whose payloads are (key length, value)."""
+    automaton = ahocorasick.Automaton()
+    for key, value in table.items():
+        automaton.add_word(key, (len(key), value))
+    automaton.make_automaton()
+    return automaton
+
+
+_DEFAULT_AUTOMATON = _build_automaton(_DEFAULT_TABLE) if ahocorasick else None
+
+
+# The default transform is specialized to the available backend once at
+# import, so per-call bytecode is straight-line with no backend branch.
+# Both variants produce identical output: the automaton matches
+# leftmost-longest, and the regex alternation is ordered longest-first.
+if ahocorasick:
+    def _apply_default_table(fmt: str) -> str:
+        """Apply the default replacement table via the Aho-Corasick automaton."""
+        parts = []
+        append = parts.append  # localize to skip the attribute lookup per token
+        last = 0
+        for end, (length, value) in _DEFAULT_AUTOMATON.iter_long(fmt):
+            append(fmt[last:end - length + 1])
+            append(value)
+            last = end + 1
+        append(fmt[last:])
+        return "".join(parts).translate(_SINGLE_CHAR_TRANS)
+else:
+    def _apply_default_table(fmt: str) -> str:
+        """Apply the default replacement table via one regex substitution."""
+        return _DEFAULT_SUB(_default_dispatch, fmt).translate(_SINGLE_CHAR_TRANS)
+
+# Timezone abbreviations that ez_format cannot round-trip.
+_INVALID_TIMEZONES = ("PST", "EST", "CST", "MST", "AST", "HST", "AKST", "PDT",
+                      "EDT", "CDT", "MDT", "ADT", "HADT", "AKDT", "GMT")
+
+# One compiled scan catches both a " +/-dddd" UTC offset and any unsupported
+# timezone abbreviation, replacing a per-abbreviation substring loop.
+_TZ_PATTERN = re.compile(
+    r"(?P<offset> [+-]\d{4})|(?P<abbrev>"
+    + "|".join(sorted(_INVALID_TIMEZONES, key=len, reverse=True))
+    + ")"
+)
 
 
 def is_zone_free(fmt: str):
@@ -39,22 +169,14 @@ def is_zone_free(fmt: str):
        bool: True if the datetime string does not contain timezone information, False otherwise.
 
     """
-    # Regex to detect the pattern +/-dddd
-    tz_offset_pattern = r" [+-]\d{4}"
-    # List of invalid timezone strings
-    invalid_timezones = ["PST", "EST", "CST", "MST", "AST", "HST", "AKST", "PDT", "EDT",
-                         "CDT", "MDT", "ADT", "HADT", "AKDT", "GMT"]
-
-    # Check for +/-dddd offset
-    if re.search(tz_offset_pattern, fmt):
-        msg = f"Invalid format string: '{fmt}' contains unsupported +/-dddd patterns."
+    match = _TZ_PATTERN.search(fmt)
+    if match:
+        if match.group("offset"):
+            msg = f"Invalid format string: '{fmt}' contains unsupported +/-dddd patterns."
+        else:
+            msg = (f"Invalid format string: '{fmt}' contains unsupported "
+                   f"timezone '{match.group('abbrev')}'.")
         raise ValueError(msg)
-
-    # Check for invalid timezone abbreviations
-    for tz in invalid_timezones:
-        if tz in fmt:
-            msg = f"Invalid format string: '{fmt}' contains unsupported timezone '{tz}'."
-            raise ValueError(msg)
     return True
 
 
@@ -120,6 +242,11 @@ def ez_format(fmt: str,
           (via `format()` or manual replacement), followed by datetime token replacements.
     """
 
+    # The common case (default macros and replacements) is memoized, so a
+    # format string that was seen before costs one cache lookup.
+    if macros is None and replacements is None:
+        return _ez_format_default(fmt)
+
     macros = macros or MACRO_LOOKUP_TABLE
     replacements = replacements or DATETIME_LOOKUP_TABLE
 
@@ -128,11 +255,26 @@ def ez_format(fmt: str,
     # Use the .format to map all macros such as {DAY} and {MONTH} using format
     fmt = fmt.format(**macros)
 
-    # Perform replacements using the mapping
-    for key, value in replacements.items():
-        fmt = fmt.replace(key, value)
+    # Perform all replacements in a single scan of the string.
+    pattern = _compile_replacements(tuple(replacements))
+    return pattern.sub(lambda m: replacements[m.group(0)], fmt)
+
+
+@functools.lru_cache(maxsize=1024)
+def _ez_format_default(fmt: str) -> str:
+    """
+    Memoized ez_format core for the default macro and replacement tables.
 
-    return fmt
+    Format strings tend to be reused heavily (e.g., formatting many datetimes
+    with the same pattern in a loop), so repeated calls return the previously
+    transformed string without re-running validation or substitution.
+    """
+    is_zone_free(fmt)
+    fmt = fmt.format(**MACRO_LOOKUP_TABLE)
+    # Intern the transformed string so every cache hit hands strftime the
+    # same string object, keeping downstream identity checks and dict
+    # lookups on the format string as cheap as possible.
+    return sys.intern(_apply_default_table(fmt))
 
 
 class datetime_ez(dt.datetime):
@@ -296,7 +438,49 @@ class datetime_ez(dt.datetime):
             >>> snap.ezftime("{YEAR4}-{MONTH#}-{DAY#} %H:%M")
             "2004-10-31 13:12"
         """
-        return self.strftime(ez_format(fmt))
+        # Call the memoized core directly: on a warm cache this is one dict
+        # hit, with no validation or substitution re-run.
+        return self.strftime(_ez_format_default(fmt))
+
+    @classmethod
+    def ezftime_many(cls, fmt: str, datetimes) -> list[str]:
+        """
+        Format a sequence of datetimes with a single ezftime format string.
+
+        The format is transformed once through the memoized core, so the
+        per-element cost is one `strftime` call rather than a full macro and
+        replacement pass each.  When pandas is installed, the element loop is
+        pushed into its vectorized `DatetimeIndex.strftime`.
+
+        Args:
+            fmt (str): An ezftime format string (macros and/or canonical tokens).
+            datetimes: An iterable of `datetime` (or `datetime_ez`) objects.
+
+        Returns:
+            list[str]: The formatted string for each input datetime, in order.
+
+        Examples:
+            >>> snaps = [datetime_ez(2004, 10, 31, 13, 12, 11),
+            ...          datetime_ez(2023, 1, 2, 3, 4, 5)]
+            >>> datetime_ez.ezftime_many("{YEAR4}-{MONTH#}-{DAY#}", snaps)
+            ['2004-10-31', '2023-01-02']
+        """
+        transformed = _ez_format_default(fmt)
+        if pandas is not None:
+            if not isinstance(datetimes, (list, tuple)):
+                # Materialize one-shot iterators so the fallback below still
+                # sees every element if pandas rejects the input.
+                datetimes = list(datetimes)
+            try:
+                index = pandas.DatetimeIndex(datetimes)
+            except (TypeError, ValueError):
+                # pandas refuses some inputs the plain loop handles fine
+                # (e.g. mixed naive/aware datetimes or differing offsets);
+                # fall through to per-element formatting.
+                pass
+            else:
+                return index.strftime(transformed).tolist()
+        return [d.strftime(transformed) for d in datetimes]
 
 
 def make_d8fmt_parser() -> argparse.ArgumentParser:
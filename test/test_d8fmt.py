@@ -224,3 +224,10 @@ def test_locale_date_format(set_locale):
     assert date1 == date2
 
 
+def test_non_ascii_literal_text_passes_through():
+    """
+    Literal text in a format string is not limited to ASCII; only the
+    replacement tokens themselves are. Non-ASCII characters must survive the
+    transform untouched.
+    """
+    assert ez_format("Fête du 31 October: 13:12") == "Fête du %d %B: %H:%M"
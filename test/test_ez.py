@@ -62,3 +62,34 @@ def test_datetime_ez_from_existing_datetime():
     assert new_dt_ez.second == original_dt.second
     assert new_dt_ez.microsecond == original_dt.microsecond
     assert new_dt_ez.tzinfo == original_dt.tzinfo
+
+
+def test_datetime_ez_ezftime_many():
+    """
+    Verifies that batch formatting via `ezftime_many` matches formatting each
+    datetime individually with `ezftime`.
+    """
+    snaps = [
+        datetime_ez(2004, 10, 31, 13, 12, 11),
+        datetime_ez(2023, 1, 2, 3, 4, 5),
+        datetime_ez(1999, 12, 31, 23, 59, 59),
+    ]
+    fmt = "{DAY}, {MONTH} {DAY#}, {YEAR4} {HOUR24}:{MINUTE}:{SECOND}"
+    assert datetime_ez.ezftime_many(fmt, snaps) == [snap.ezftime(fmt) for snap in snaps]
+
+
+def test_datetime_ez_ezftime_many_mixed_timezones():
+    """
+    Batch formatting must handle sequences mixing naive and aware datetimes
+    (and differing offsets), which vectorized backends may reject.
+    """
+    snaps = [
+        datetime_ez(2004, 10, 31, 13, 12, 11),
+        datetime_ez(2004, 10, 31, 13, 12, 11, tzinfo=datetime.timezone.utc),
+        datetime_ez(2004, 10, 31, 13, 12, 11,
+                    tzinfo=datetime.timezone(datetime.timedelta(hours=5, minutes=30))),
+        datetime_ez(2004, 10, 31, 13, 12, 11,
+                    tzinfo=datetime.timezone(datetime.timedelta(hours=-4))),
+    ]
+    fmt = "{DAY}, {MONTH} {DAY#}, {YEAR4} {HOUR24}:{MINUTE}:{SECOND}"
+    assert datetime_ez.ezftime_many(fmt, snaps) == [snap.ezftime(fmt) for snap in snaps]